@@ -44,6 +44,14 @@ class Path(pathlib.Path):
 		"""
 		if sys.version_info >= (3, 13):
 			text = super().read_text(encoding, errors, newline)
+		elif newline is None and encoding is not None and encoding != "locale":
+			# Read the raw bytes in a single unbuffered call and decode in one shot,
+			# skipping the BufferedReader + TextIOWrapper stack and its extra syscalls.
+			with self.open(mode="rb", buffering=0) as fb:
+				data = fb.read()
+			text = data.decode(encoding, errors or "strict")
+			# Translate universal newlines, as TextIOWrapper would have done.
+			text = text.replace("\r\n", "\n").replace("\r", "\n")
 		else:
 			if hasattr(io, "text_encoding"):
 				encoding = io.text_encoding(encoding)
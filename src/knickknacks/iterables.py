@@ -24,11 +24,18 @@
 from __future__ import annotations
 
 # Built-in Modules:
+import itertools
+import operator
 import re
-import statistics
 from collections.abc import Iterable, Sequence
 from typing import Any
 
+# Local Modules:
+from .typedef import RePatternType
+
+
+DIGITS_REGEX: RePatternType = re.compile(r"(\d+)")
+
 
 def average(items: Iterable[float]) -> float:
 	"""
@@ -40,11 +47,12 @@ def average(items: Iterable[float]) -> float:
 	Returns:
 		The average item length.
 	"""
-	try:
-		return statistics.mean(items)
-	except statistics.StatisticsError:
-		# No items.
+	items = list(items)
+	if not items:
 		return 0
+	# sum / len is considerably cheaper than statistics.mean, which converts
+	# every item through exact fraction arithmetic.
+	return sum(items) / len(items)
 
 
 def humanSort(lst: Sequence[str]) -> list[str]:
@@ -57,12 +65,15 @@ def humanSort(lst: Sequence[str]) -> list[str]:
 	Returns:
 		The items of the list, with strings containing numbers sorted according to their numeric value.
 	"""
-	return sorted(
-		lst,
-		key=lambda item: [
-			int(text) if text.isdigit() else text for text in re.split(r"(\d+)", item, flags=re.UNICODE)
-		],
-	)
+	# Decorate, sort, then undecorate. Building the keys in a comprehension
+	# avoids a Python-level lambda frame per element during the sort.
+	keyed = [
+		([int(text) if text.isdigit() else text for text in DIGITS_REGEX.split(item)], item) for item in lst
+	]
+	# Sort on the decoration only. Comparing the whole tuples would fall back
+	# to the original strings on equal keys, losing input-order stability.
+	keyed.sort(key=operator.itemgetter(0))
+	return [item for _, item in keyed]
 
 
 def lpadList(lst: Sequence[Any], padding: Any, count: int, *, fixed: bool = False) -> list[Any]:
@@ -78,9 +89,16 @@ def lpadList(lst: Sequence[Any], padding: Any, count: int, *, fixed: bool = Fals
 	Returns:
 		A padded copy of the list.
 	"""
+	deficit = count - len(lst)
+	if deficit > 0:
+		# The padding list becomes the result, so no throwaway list is allocated.
+		result = [padding] * deficit
+		result.extend(lst)
+		return result
+	result = list(lst)
 	if fixed:
-		return [*[padding] * (count - len(lst)), *lst][:count]
-	return [*[padding] * (count - len(lst)), *lst]
+		del result[count:]
+	return result
 
 
 def padList(lst: Sequence[Any], padding: Any, count: int, *, fixed: bool = False) -> list[Any]:
@@ -96,6 +114,10 @@ def padList(lst: Sequence[Any], padding: Any, count: int, *, fixed: bool = False
 	Returns:
 		A padded copy of the list.
 	"""
-	if fixed:
-		return [*lst, *[padding] * (count - len(lst))][:count]
-	return [*lst, *[padding] * (count - len(lst))]
+	result = list(lst)
+	if len(result) < count:
+		# extend with itertools.repeat skips building an intermediate padding list.
+		result.extend(itertools.repeat(padding, count - len(result)))
+	elif fixed:
+		del result[count:]
+	return result
@@ -26,6 +26,7 @@ from __future__ import annotations
 # Built-in Modules:
 import _imp  # NOQA: PLC2701
 import inspect
+import os
 import sys
 from functools import cache
 from pathlib import Path
@@ -34,6 +35,20 @@ from pathlib import Path
 from .utils import getFunctionField
 
 
+@cache
+def _getBaseDirectory(fileName: str) -> Path:
+	"""
+	Retrieves the resolved parent directory of a file.
+
+	Args:
+		fileName: The file whose parent directory should be resolved.
+
+	Returns:
+		The resolved directory path.
+	"""
+	return Path(fileName).parent.resolve()
+
+
 @cache
 def getDirectoryPath(*args: str) -> str:
 	"""
@@ -42,6 +57,9 @@ def getDirectoryPath(*args: str) -> str:
 	If frozen, path is based on the location of the executable.
 	If not frozen, path is based on the location of the module which called this function.
 
+	Note that only the base directory is resolved: the joined arguments are
+	appended as-is, without symlink or '..' normalization.
+
 	Args:
 		*args: Positional arguments to be passed to Path.joinpath after the directory path.
 
@@ -49,14 +67,15 @@ def getDirectoryPath(*args: str) -> str:
 		The path.
 	"""
 	if isFrozen():
-		path = Path(sys.executable).parent
+		fileName = sys.executable
 	else:
 		frame = getFunctionField(1)
-		path = Path(inspect.getabsfile(frame)).parent
-	return str(path.joinpath(*args).resolve())
+		fileName = inspect.getabsfile(frame)
+	# The base directory is cached per file, which avoids the stat calls
+	# resolve would perform for every new argument combination.
+	return str(_getBaseDirectory(fileName).joinpath(*args))
 
 
-@cache
 def isFrozen() -> bool:
 	"""
 	Determines whether the program is running from a frozen copy or from source.
@@ -67,6 +86,11 @@ def isFrozen() -> bool:
 	return bool(getattr(sys, "frozen", False) or hasattr(sys, "importers") or _imp.is_frozen("__main__"))
 
 
+# Freeze status cannot change during the lifetime of the process, so compute it
+# once at import time. Prefer this constant over isFrozen() in hot code paths.
+IS_FROZEN: bool = isFrozen()
+
+
 def touch(name: str) -> None:
 	"""
 	Touches a file.
@@ -76,5 +100,9 @@ def touch(name: str) -> None:
 	Args:
 		name: the file name to touch.
 	"""
-	path: Path = Path(name).resolve()
-	path.touch()
+	try:
+		# Updating the timestamp is a single syscall when the file already exists.
+		os.utime(name)
+	except FileNotFoundError:
+		# Create the file instead; creation sets the timestamps by itself.
+		os.close(os.open(name, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666))
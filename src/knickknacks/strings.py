@@ -26,19 +26,56 @@ from __future__ import annotations
 # Built-in Modules:
 import re
 import textwrap
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 # Local Modules:
-from .typedef import BytesOrStrType, RePatternType
+from .typedef import BytesOrStrType, ReBytesPatternType, RePatternType
 
 
 ANSI_COLOR_REGEX: RePatternType = re.compile(r"\x1b\[[\d;]+m")
-INDENT_REGEX: RePatternType = re.compile(r"^(?P<indent>\s*)(?P<text>.*)", flags=re.UNICODE)
-WHITE_SPACE_REGEX: RePatternType = re.compile(r"\s+", flags=re.UNICODE)
+INDENT_REGEX: RePatternType = re.compile(r"^(?P<indent>\s*)(?P<text>.*)")
+WHITE_SPACE_REGEX: RePatternType = re.compile(r"\s+")
 # Use negative look-ahead to exclude the space character from the \s character class.
 # Another way to accomplish this would be to use negation (I.E. [^\S ]+).
-WHITE_SPACE_EXCEPT_SPACE_REGEX: RePatternType = re.compile(r"(?:(?![ ])\s+)", flags=re.UNICODE)
+WHITE_SPACE_EXCEPT_SPACE_REGEX: RePatternType = re.compile(r"(?:(?![ ])\s+)")
+# Translation table for deleting ASCII white space characters with str.translate,
+# which is considerably faster than substituting with WHITE_SPACE_REGEX.
+# Note that \s also matches the ASCII separator characters \x1c-\x1f.
+WHITE_SPACE_DELETE_TABLE: dict[int, Union[int, None]] = str.maketrans("", "", " \t\n\r\v\f\x1c\x1d\x1e\x1f")
+
+
+@lru_cache(maxsize=256)
+def _compileBytesReplacements(
+	replacements: tuple[tuple[bytes, bytes], ...],
+) -> tuple[ReBytesPatternType, dict[bytes, bytes]]:
+	"""
+	Compiles a sequence of bytes replacement pairs into an alternation pattern and a mapping.
+
+	Args:
+		replacements: A tuple of tuples, each containing the bytes to match and the replacement.
+
+	Returns:
+		The compiled pattern matching any of the keys, and a dict mapping keys to replacements.
+	"""
+	pattern = re.compile(b"|".join(re.escape(old) for old, new in replacements))
+	return pattern, dict(replacements)
+
+
+@lru_cache(maxsize=256)
+def _compileReplacements(replacements: tuple[tuple[str, str], ...]) -> tuple[RePatternType, dict[str, str]]:
+	"""
+	Compiles a sequence of replacement pairs into an alternation pattern and a mapping.
+
+	Args:
+		replacements: A tuple of tuples, each containing the text to match and the replacement.
+
+	Returns:
+		The compiled pattern matching any of the keys, and a dict mapping keys to replacements.
+	"""
+	pattern = re.compile("|".join(re.escape(old) for old, new in replacements))
+	return pattern, dict(replacements)
 
 
 def camelCase(text: str, delimiter: str) -> str:
@@ -52,59 +89,89 @@ def camelCase(text: str, delimiter: str) -> str:
 	Returns:
 		The text in camel case.
 	"""
-	words = text.split(delimiter)
-	return "".join((*map(str.lower, words[:1]), *map(str.title, words[1:])))
+	first, *rest = text.split(delimiter)
+	return first.lower() + "".join(map(str.title, rest))
 
 
-def formatDocString(
-	functionOrString: Union[str, Callable[..., Any]], width: int = 79, prefix: Optional[str] = None
-) -> str:
+@lru_cache(maxsize=256)
+def _formatDocString(docString: str, width: int, prefix: Optional[str]) -> str:
 	"""
-	Formats a docstring for displaying.
+	Performs the actual formatting for formatDocString.
 
 	Args:
-		functionOrString: The function containing the docstring, or the docstring its self.
+		docString: The docstring to be formatted.
 		width: The number of characters to word wrap each line to.
 		prefix: One or more characters to use for indention.
 
 	Returns:
 		The formatted docstring.
 	"""
-	docString = getattr(functionOrString, "__doc__", "") if callable(functionOrString) else functionOrString
 	# Remove any empty lines from the beginning, while keeping indention.
 	docString = docString.lstrip("\r\n")
-	match = INDENT_REGEX.search(docString)
-	if match is not None and not match.group("indent"):
+	if not docString.startswith((" ", "\t")):
 		# The first line was not indented.
 		# Prefix the first line with the white space from the subsequent, non-empty
 		# line with the least amount of indention.
 		# This is needed so that textwrap.dedent will work.
-		docString = minIndent("\n".join(docString.splitlines()[1:])) + docString
+		# Handing the split lines straight to _minIndent skips a join + re-split round trip.
+		docString = _minIndent(docString.splitlines()[1:]) + docString
 	docString = textwrap.dedent(docString)  # Remove common indention from lines.
 	docString = docString.rstrip()  # Remove trailing white space from the end of the docstring.
 	# Word wrap long lines, while maintaining existing structure.
-	wrappedLines = []
+	# One local wrapper per call keeps the width mutation below off any
+	# shared state, and the lru_cache on this function amortizes the
+	# construction cost. Turning off hyphen splitting selects the simpler
+	# tokenizer regex inside textwrap.
+	wrapper = textwrap.TextWrapper(break_long_words=False, break_on_hyphens=False)
+	lines = docString.splitlines()
+	# Preallocate the output list. Every input line produces exactly one entry,
+	# so assigning by index avoids the amortized resize copies of append.
+	wrappedLines = [""] * len(lines)
 	indentLevel = 0
-	lastIndent = ""
-	for line in docString.splitlines():
-		match = INDENT_REGEX.search(line)
-		if match is None:  # pragma: no cover
-			continue
-		indent, text = match.groups()
-		if len(indent) > len(lastIndent):
+	lastIndentLength = 0
+	# Cache the prefix string for each indent level, so repeated levels don't rebuild it.
+	prefixCache: dict[int, str] = {}
+	for i, line in enumerate(lines):
+		# Extract the indent with lstrip length arithmetic, avoiding a regex search per line.
+		text = line.lstrip()
+		indentLength = len(line) - len(text)
+		if indentLength > lastIndentLength:
 			indentLevel += 1
-		elif len(indent) < len(lastIndent):
+		elif indentLength < lastIndentLength:
 			indentLevel -= 1
-		lastIndent = indent
-		linePrefix = prefix * indentLevel if prefix else indent
-		lines = textwrap.wrap(
-			text, width=width - len(linePrefix), break_long_words=False, break_on_hyphens=False
-		)
-		wrappedLines.append(linePrefix + f"\n{linePrefix}".join(lines))
+		lastIndentLength = indentLength
+		if prefix:
+			linePrefix = prefixCache.get(indentLevel)
+			if linePrefix is None:
+				linePrefix = prefix * indentLevel
+				prefixCache[indentLevel] = linePrefix
+		else:
+			linePrefix = line[:indentLength]
+		wrapper.width = width - len(linePrefix)
+		wrappedLines[i] = linePrefix + ("\n" + linePrefix).join(wrapper.wrap(text))
 	# Indent docstring lines with the prefix.
 	return textwrap.indent("\n".join(wrappedLines), prefix=prefix or "")
 
 
+def formatDocString(
+	functionOrString: Union[str, Callable[..., Any]], width: int = 79, prefix: Optional[str] = None
+) -> str:
+	"""
+	Formats a docstring for displaying.
+
+	Args:
+		functionOrString: The function containing the docstring, or the docstring its self.
+		width: The number of characters to word wrap each line to.
+		prefix: One or more characters to use for indention.
+
+	Returns:
+		The formatted docstring.
+	"""
+	docString = getattr(functionOrString, "__doc__", "") if callable(functionOrString) else functionOrString
+	# Formatting is pure and docstrings are immutable, so cached results can be reused.
+	return _formatDocString(docString, width, prefix)
+
+
 def hasWhiteSpace(text: str) -> bool:
 	"""
 	Determines if string contains white space.
@@ -131,6 +198,28 @@ def hasWhiteSpaceExceptSpace(text: str) -> bool:
 	return WHITE_SPACE_EXCEPT_SPACE_REGEX.search(text) is not None
 
 
+def _minIndent(lines: Iterable[str]) -> str:
+	"""
+	Retrieves the indention characters from the line with the least indention.
+
+	Args:
+		lines: The lines to process.
+
+	Returns:
+		The indention characters of the line with the least amount of indention.
+	"""
+	minimum: Optional[int] = None
+	indent = ""
+	for line in lines:
+		if line.strip("\r\n"):
+			# lstrip length arithmetic measures the indent without a regex or a per-character loop.
+			length = len(line) - len(line.lstrip())
+			if minimum is None or length < minimum:
+				minimum = length
+				indent = line[:length]
+	return indent
+
+
 def minIndent(text: str) -> str:
 	"""
 	Retrieves the indention characters from the line with the least indention.
@@ -141,19 +230,16 @@ def minIndent(text: str) -> str:
 	Returns:
 		The indention characters of the line with the least amount of indention.
 	"""
-	lines = []
-	for line in text.splitlines():
-		if line.strip("\r\n"):
-			match = INDENT_REGEX.search(line)
-			if match is not None:
-				lines.append(match.group("indent"))
-	return min(lines, default="", key=len)
+	return _minIndent(text.splitlines())
 
 
 def multiReplace(data: BytesOrStrType, replacements: Sequence[Sequence[BytesOrStrType]]) -> BytesOrStrType:
 	"""
 	Performs multiple replacement operations on a string or bytes-like object.
 
+	The replacements are applied in a single pass, so replaced text is never
+	rescanned by later replacement pairs.
+
 	Args:
 		data: The text to perform the replacements on.
 		replacements: A sequence of tuples, each containing the text to match and the replacement.
@@ -161,9 +247,15 @@ def multiReplace(data: BytesOrStrType, replacements: Sequence[Sequence[BytesOrSt
 	Returns:
 		The text with all the replacements applied.
 	"""
-	for old, new in replacements:
-		data = data.replace(old, new)
-	return data
+	if not replacements:
+		return data
+	# A single pass with an alternation pattern avoids one full pass
+	# plus one new string allocation per replacement pair.
+	if isinstance(data, str):
+		pattern, mapping = _compileReplacements(tuple((old, new) for old, new in replacements))
+		return pattern.sub(lambda match: mapping[match.group(0)], data)
+	bytesPattern, bytesMapping = _compileBytesReplacements(tuple((old, new) for old, new in replacements))
+	return bytesPattern.sub(lambda match: bytesMapping[match.group(0)], data)
 
 
 def regexFuzzy(text: Union[str, Sequence[str]]) -> str:
@@ -184,8 +276,11 @@ def regexFuzzy(text: Union[str, Sequence[str]]) -> str:
 	if not text:
 		return ""
 	if isinstance(text, str):
-		return "(".join(list(text)) + ")?" * (len(text) - 1)
-	return "|".join("(".join(list(item)) + ")?" * (len(item) - 1) for item in text)
+		# str.join iterates a string's characters directly, so no intermediate list is needed.
+		return "(".join(text) + ")?" * (len(text) - 1)
+	# Join over a list rather than a generator, because str.join materializes
+	# its argument anyway and handing it a list avoids the generator overhead.
+	return "|".join(["(".join(item) + ")?" * (len(item) - 1) for item in text])
 
 
 def removeWhiteSpace(text: str) -> str:
@@ -198,6 +293,8 @@ def removeWhiteSpace(text: str) -> str:
 	Returns:
 		The simplified version of the text.
 	"""
+	if text.isascii():
+		return text.translate(WHITE_SPACE_DELETE_TABLE)
 	return WHITE_SPACE_REGEX.sub("", text)
 
 
@@ -224,7 +321,10 @@ def simplified(text: str) -> str:
 	Returns:
 		The simplified version of the text.
 	"""
-	return WHITE_SPACE_REGEX.sub(" ", text).strip()
+	# str.split with no arguments collapses runs of white space and strips both
+	# ends in a single C pass, with no regex engine involvement. It uses the
+	# same white space predicate as \s, so Unicode input behaves identically.
+	return " ".join(text.split())
 
 
 def stripAnsi(text: str) -> str:
@@ -237,4 +337,8 @@ def stripAnsi(text: str) -> str:
 	Returns:
 		The text with ANSI escape sequences stripped.
 	"""
+	if "\x1b" not in text:
+		# C-optimized str.__contains__ is much cheaper than a regex scan,
+		# and escape-free text is the common case.
+		return text
 	return ANSI_COLOR_REGEX.sub("", text)
@@ -27,27 +27,60 @@ from __future__ import annotations
 import re
 import sys
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 
+# Static analysis always binds the gated names, so annotations in this module
+# and its consumers resolve under every target version; at runtime the
+# typing_extensions fallbacks stay lazy through __getattr__ below.
 if sys.version_info >= (3, 12):
 	from typing import override
-else:
+elif TYPE_CHECKING:
 	from typing_extensions import override
 if sys.version_info >= (3, 11):
 	from typing import Self
-else:
+elif TYPE_CHECKING:
 	from typing_extensions import Self
 if sys.version_info >= (3, 10):
 	from typing import ParamSpec, TypeAlias
-else:
+elif TYPE_CHECKING:
 	from typing_extensions import ParamSpec, TypeAlias
 # Literal from typing module has various issues in different Python versions, see:
 # https://typing-extensions.readthedocs.io/en/latest/#Literal
-if sys.version_info >= (3, 10, 1) or (3, 9, 8) <= sys.version_info < (3, 10):
+# TYPE_CHECKING comes first so mypy always binds Literal from typing, rather
+# than checking both branches of the patch-version gate.
+if TYPE_CHECKING or sys.version_info >= (3, 10, 1) or (3, 9, 8) <= sys.version_info < (3, 10):
 	from typing import Literal
-else:
-	from typing_extensions import Literal  # type: ignore[assignment]
+
+# Names which fall back to typing_extensions when not provided by the running interpreter.
+_TYPING_EXTENSIONS_NAMES: frozenset[str] = frozenset(
+	{"Literal", "ParamSpec", "Self", "TypeAlias", "override"}
+)
+
+
+def __getattr__(name: str) -> Any:
+	"""
+	Lazily resolves names which must be imported from typing_extensions.
+
+	Deferring the import means the cost of loading typing_extensions is only
+	paid if one of the backported names is actually requested.
+
+	Args:
+		name: The name of the attribute to be resolved.
+
+	Returns:
+		The resolved attribute.
+
+	Raises:
+		AttributeError: The attribute cannot be resolved.
+	"""
+	if name in _TYPING_EXTENSIONS_NAMES:
+		import typing_extensions  # NOQA: PLC0415
+
+		value = getattr(typing_extensions, name)
+		globals()[name] = value  # Cache the value, so __getattr__ only runs once per name.
+		return value
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 AnyMappingType: TypeAlias = Mapping[Any, Any]
@@ -83,5 +83,8 @@ def page(lines: Sequence[str]) -> None:
 	width, _ = shutil.get_terminal_size()
 	# Word wrapping to 1 less than the terminal width is necessary to prevent
 	# occasional blank lines in the terminal output.
-	text = "\n".join(textwrap.fill(line.strip(), width - 1) for line in lines)
+	# One shared TextWrapper avoids the instance textwrap.fill would construct
+	# per line, while keeping fill's default wrap policy.
+	wrapper = textwrap.TextWrapper(width=width - 1)
+	text = "\n".join(wrapper.fill(line.strip()) for line in lines)
 	pager(text)
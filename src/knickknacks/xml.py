@@ -28,7 +28,6 @@ import re
 from typing import Union
 
 # Local Modules:
-from .strings import multiReplace
 from .typedef import ReBytesPatternType, RePatternType
 
 
@@ -42,6 +41,9 @@ UNESCAPE_XML_STR_ENTITIES: tuple[tuple[str, str], ...] = tuple(
 		tuple((second, first) for first, second in ESCAPE_XML_STR_ENTITIES)
 	)
 )
+# Translation table for escaping < and > in one C-level pass; & is handled
+# separately with str.replace since it must be escaped first.
+ESCAPE_XML_STR_TABLE: dict[int, str] = str.maketrans({"<": "&lt;", ">": "&gt;"})
 
 ESCAPE_XML_BYTES_ENTITIES: tuple[tuple[bytes, bytes], ...] = tuple(
 	(bytes(first, "us-ascii"), bytes(second, "us-ascii")) for first, second in ESCAPE_XML_STR_ENTITIES
@@ -51,6 +53,11 @@ UNESCAPE_XML_BYTES_ENTITIES: tuple[tuple[bytes, bytes], ...] = tuple(
 )
 
 UNESCAPE_XML_NUMERIC_BYTES_REGEX: ReBytesPatternType = re.compile(rb"&#(?P<hex>x?)(?P<value>[0-9a-zA-Z]+);")
+UNESCAPE_XML_NAMED_BYTES_ENTITIES: dict[bytes, bytes] = {b"amp": b"&", b"lt": b"<", b"gt": b">"}
+# Matches numeric and named entities alike, so unescaping needs only one pass.
+UNESCAPE_XML_BYTES_REGEX: ReBytesPatternType = re.compile(
+	rb"&(?:#(?P<hex>x?)(?P<value>[0-9a-zA-Z]+)|(?P<named>amp|lt|gt));"
+)
 XML_ATTRIBUTE_REGEX: RePatternType = re.compile(r"([\w-]+)(\s*=+\s*('[^']*'|\"[^\"]*\"|(?!['\"])[^\s]*))?")
 
 
@@ -64,7 +71,7 @@ def escapeXMLString(text: str) -> str:
 	Returns:
 		A copy of the string with XML entities escaped.
 	"""
-	return multiReplace(text, ESCAPE_XML_STR_ENTITIES)
+	return text.replace("&", "&amp;").translate(ESCAPE_XML_STR_TABLE)
 
 
 def getXMLAttributes(text: str) -> dict[str, Union[str, None]]:
@@ -83,14 +90,17 @@ def getXMLAttributes(text: str) -> dict[str, Union[str, None]]:
 		The extracted attributes.
 	"""
 	attributes: dict[str, Union[str, None]] = {}
-	for name, rest, value in XML_ATTRIBUTE_REGEX.findall(text):
+	# Iterating over match objects avoids materializing a list of tuples, unlike findall.
+	for match in XML_ATTRIBUTE_REGEX.finditer(text):
+		name, rest, value = match.group(1, 2, 3)
 		if not rest:
 			attributes[name.lower()] = None
-		elif value[:1] == "'" == value[-1:] or value[:1] == '"' == value[-1:]:
+			continue
+		quote = value[:1]
+		if quote in "\"'" and value.endswith(quote):
 			# The value is enclosed in single or double quotes.
-			attributes[name.lower()] = value[1:-1]  # Strip the quotes from beginning and end.
-		else:
-			attributes[name.lower()] = value
+			value = value[1:-1]  # Strip the quotes from beginning and end.
+		attributes[name.lower()] = value
 	return attributes
 
 
@@ -106,10 +116,11 @@ def unescapeXMLBytes(data: bytes) -> bytes:
 	"""
 
 	def referenceToBytes(match: re.Match[bytes]) -> bytes:
+		named: Union[bytes, None] = match.group("named")
+		if named is not None:
+			return UNESCAPE_XML_NAMED_BYTES_ENTITIES[named]
 		isHex: bytes = match.group("hex")
 		value: bytes = match.group("value")
 		return bytes((int(value, 16 if isHex else 10),))
 
-	return multiReplace(
-		UNESCAPE_XML_NUMERIC_BYTES_REGEX.sub(referenceToBytes, data), UNESCAPE_XML_BYTES_ENTITIES
-	)
+	return UNESCAPE_XML_BYTES_REGEX.sub(referenceToBytes, data)
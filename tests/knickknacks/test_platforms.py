@@ -22,8 +22,9 @@
 from __future__ import annotations
 
 # Built-in Modules:
-import sys
+import os
 from pathlib import Path
+from typing import Optional
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -32,43 +33,73 @@ from knickknacks import platforms
 
 
 class TestPlatforms(TestCase):
+	def patchAttribute(self, attribute: str) -> Mock:
+		# Binding patch.object once with addCleanup is cheaper than stacking
+		# @patch decorators, which re-resolve the target string per test run.
+		patcher = patch.object(platforms, attribute)
+		mock = patcher.start()
+		self.addCleanup(patcher.stop)
+		return mock
+
 	@patch("knickknacks.platforms.isFrozen")
 	def test_getDirectoryPath(self, mockIsFrozen: Mock) -> None:
 		subdirectory: tuple[str, ...] = ("level1", "level2")
-		frozenDirName: Path = Path(sys.executable).parent
-		frozenOutput: str = str(frozenDirName.joinpath(*subdirectory).resolve())
-		mockIsFrozen.return_value = True
-		self.assertEqual(platforms.getDirectoryPath(*subdirectory), frozenOutput)
-		platforms.getDirectoryPath.cache_clear()
-		# The location of the file which called the function, I.E. this file.
-		unfrozenDirName: Path = Path(__file__).parent
-		unfrozenOutput: str = str(unfrozenDirName.joinpath(*subdirectory).resolve())
-		mockIsFrozen.return_value = False
-		self.assertEqual(platforms.getDirectoryPath(*subdirectory), unfrozenOutput)
+		frozenBase: Path = Path("frozen", "fake")
+		unfrozenBase: Path = Path("unfrozen", "fake")
+		self.addCleanup(platforms.getDirectoryPath.cache_clear)
+		self.addCleanup(platforms._getBaseDirectory.cache_clear)  # NOQA: SLF001
+		platforms._getBaseDirectory.cache_clear()  # NOQA: SLF001
+		# Mocking out resolve keeps the test from touching the file system.
+		# Path here is the same class platforms uses, so the patch is shared.
+		with patch.object(Path, "resolve", side_effect=(frozenBase, unfrozenBase)):
+			mockIsFrozen.return_value = True
+			self.assertEqual(
+				platforms.getDirectoryPath(*subdirectory), str(frozenBase.joinpath(*subdirectory))
+			)
+			platforms.getDirectoryPath.cache_clear()
+			mockIsFrozen.return_value = False
+			self.assertEqual(
+				platforms.getDirectoryPath(*subdirectory), str(unfrozenBase.joinpath(*subdirectory))
+			)
 
-	@patch("knickknacks.platforms._imp")
-	@patch("knickknacks.platforms.sys")
-	def test_getFreezer(self, mockSys: Mock, mockImp: Mock) -> None:
-		mockSys.frozen = False
-		del mockSys.importers
-		mockImp.is_frozen.return_value = False
-		self.assertFalse(platforms.isFrozen())
-		platforms.isFrozen.cache_clear()
-		mockImp.is_frozen.return_value = True
-		self.assertTrue(platforms.isFrozen())
-		platforms.isFrozen.cache_clear()
-		mockImp.is_frozen.return_value = False
-		mockSys.importers = True
-		self.assertTrue(platforms.isFrozen())
-		platforms.isFrozen.cache_clear()
-		del mockSys.importers
-		mockSys.frozen = True
-		self.assertTrue(platforms.isFrozen())
-		platforms.isFrozen.cache_clear()
-		mockSys.frozen = False
-		self.assertFalse(platforms.isFrozen())
+	def test_getFreezer(self) -> None:
+		mockSys: Mock = self.patchAttribute("sys")
+		mockImp: Mock = self.patchAttribute("_imp")
+		scenarios: tuple[tuple[bool, Optional[bool], bool, bool], ...] = (
+			# Row order matches the subTest keyword arguments below, with the
+			# expected result last.
+			(False, None, False, False),
+			(False, None, True, True),
+			(False, True, False, True),
+			(True, None, False, True),
+			(False, None, False, False),
+		)
+		for frozen, importers, impFrozen, expected in scenarios:
+			with self.subTest(frozen=frozen, importers=importers, impFrozen=impFrozen):
+				mockSys.frozen = frozen
+				if importers is None:
+					# Assign before deleting, since deleting an already-deleted Mock attribute raises.
+					mockSys.importers = True
+					del mockSys.importers
+				else:
+					mockSys.importers = importers
+				mockImp.is_frozen.return_value = impFrozen
+				self.assertEqual(platforms.isFrozen(), expected)
 
-	@patch("knickknacks.platforms.Path.touch")
-	def test_touch(self, mockTouch: Mock) -> None:
+	# Patching attributes on the os module itself is seen by the code under
+	# test, since platforms uses this very module object.
+	@patch.object(os, "close")
+	@patch.object(os, "utime")
+	@patch.object(os, "open")
+	def test_touch(self, mockOpen: Mock, mockUtime: Mock, mockClose: Mock) -> None:
+		# The file exists, so only the timestamp should be updated.
 		platforms.touch("path_1")
-		mockTouch.assert_called_once()
+		mockUtime.assert_called_once_with("path_1")
+		mockOpen.assert_not_called()
+		mockUtime.reset_mock()
+		# The file does not exist, so it should be created.
+		mockUtime.side_effect = FileNotFoundError
+		platforms.touch("path_2")
+		mockUtime.assert_called_once_with("path_2")
+		mockOpen.assert_called_once()
+		mockClose.assert_called_once_with(mockOpen.return_value)
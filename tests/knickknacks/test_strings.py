@@ -22,47 +22,61 @@
 from __future__ import annotations
 
 # Built-in Modules:
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Union
 from unittest import TestCase
 
 # Knickknacks Modules:
 from knickknacks import strings
 
 
+# Shared by test_formatDocString; built once at import time instead of per run.
+DOC_STRING: str = (
+	"\nTest Doc String\n"
+	+ "This is the first line below the title.\n"
+	+ "\tThis is an indented line below the first. "
+	+ "Let's make it long so we can check if word wrapping works.\n"
+	+ "This is the final line, which should be at indention level 0.\n"
+)
+EXPECTED_OUTPUT: str = (
+	"Test Doc String\n"
+	+ "This is the first line below the title.\n"
+	+ "\tThis is an indented line below the first. Let's make it long so we can check\n"
+	+ "\tif word wrapping works.\n"
+	+ "This is the final line, which should be at indention level 0."
+)
+EXPECTED_OUTPUT_INDENT_TWO_SPACE: str = "\n".join(
+	"  " + line.replace("\t", "  ") for line in EXPECTED_OUTPUT.splitlines()
+)
+DOC_STRING_FUNCTION: Callable[[], None] = lambda: None  # NOQA: E731
+DOC_STRING_FUNCTION.__doc__ = DOC_STRING
+# Shared by test_multiReplace.
+STR_REPLACEMENTS: tuple[tuple[str, str], ...] = (("ll", "yy"), ("h", "x"), ("o", "z"))
+BYTES_REPLACEMENTS: tuple[tuple[bytes, bytes], ...] = ((b"ll", b"yy"), (b"h", b"x"), (b"o", b"z"))
+# Shared by test_regexFuzzy.
+FUZZY_EAST: str = "e(a(s(t)?)?)?"
+FUZZY_EAST_WEST: str = FUZZY_EAST + "|w(e(s(t)?)?)?"
+
+
 class TestStrings(TestCase):
 	def test_camelCase(self) -> None:
 		self.assertEqual(strings.camelCase("", "_"), "")
 		self.assertEqual(strings.camelCase("this_is_a_test", "_"), "thisIsATest")
 
 	def test_formatDocString(self) -> None:
-		docString: str = (
-			"\nTest Doc String\n"
-			+ "This is the first line below the title.\n"
-			+ "\tThis is an indented line below the first. "
-			+ "Let's make it long so we can check if word wrapping works.\n"
-			+ "This is the final line, which should be at indention level 0.\n"
-		)
-		expectedOutput: str = (
-			"Test Doc String\n"
-			+ "This is the first line below the title.\n"
-			+ "\tThis is an indented line below the first. Let's make it long so we can check\n"
-			+ "\tif word wrapping works.\n"
-			+ "This is the final line, which should be at indention level 0."
-		)
-		testFunction: Callable[[], None] = lambda: None  # NOQA: E731
-		testFunction.__doc__ = docString
-		expectedOutputIndentTwoSpace: str = "\n".join(
-			"  " + line.replace("\t", "  ") for line in expectedOutput.splitlines()
-		)
 		width: int = 79
-		self.assertEqual(strings.formatDocString(docString, width), expectedOutput)
-		self.assertEqual(strings.formatDocString(docString, width, prefix=""), expectedOutput)
-		self.assertEqual(strings.formatDocString(docString, width, prefix="  "), expectedOutputIndentTwoSpace)
-		self.assertEqual(strings.formatDocString(testFunction, width), expectedOutput)
-		self.assertEqual(strings.formatDocString(testFunction, width, prefix=""), expectedOutput)
-		self.assertEqual(
-			strings.formatDocString(testFunction, width, prefix="  "), expectedOutputIndentTwoSpace
+		scenarios: tuple[tuple[Union[str, Callable[[], None]], str, str], ...] = (
+			(DOC_STRING, "", EXPECTED_OUTPUT),
+			(DOC_STRING, "  ", EXPECTED_OUTPUT_INDENT_TWO_SPACE),
+			(DOC_STRING_FUNCTION, "", EXPECTED_OUTPUT),
+			(DOC_STRING_FUNCTION, "  ", EXPECTED_OUTPUT_INDENT_TWO_SPACE),
 		)
+		# The default prefix should behave the same as explicitly passing an empty prefix.
+		self.assertEqual(strings.formatDocString(DOC_STRING, width), EXPECTED_OUTPUT)
+		self.assertEqual(strings.formatDocString(DOC_STRING_FUNCTION, width), EXPECTED_OUTPUT)
+		for docString, prefix, expected in scenarios:
+			with self.subTest(docString=type(docString).__name__, prefix=prefix):
+				self.assertEqual(strings.formatDocString(docString, width, prefix=prefix), expected)
 
 	def test_hasWhiteSpace(self) -> None:
 		ShouldBeTrue: str = "\tHello world\r\nThis  is\ta\r\n\r\ntest. "
@@ -81,30 +95,40 @@ class TestStrings(TestCase):
 		self.assertEqual(strings.minIndent("\thello\n\t\tworld"), "\t")
 
 	def test_multiReplace(self) -> None:
-		replacements: tuple[tuple[str, str], ...] = (("ll", "yy"), ("h", "x"), ("o", "z"))
-		text: str = "hello world"
-		expectedOutput: str = "xeyyz wzrld"
-		self.assertEqual(strings.multiReplace(text, replacements), expectedOutput)
-		self.assertEqual(strings.multiReplace(text, ()), text)
+		scenarios: tuple[tuple[str, tuple[tuple[str, str], ...], str], ...] = (
+			("hello world", STR_REPLACEMENTS, "xeyyz wzrld"),
+			("hello world", (), "hello world"),
+			# Replaced text is not rescanned by later replacement pairs.
+			("ab", (("a", "b"), ("b", "c")), "bc"),
+		)
+		for text, replacements, expected in scenarios:
+			with self.subTest(replacements=replacements):
+				self.assertEqual(strings.multiReplace(text, replacements), expected)
+		self.assertEqual(strings.multiReplace(b"hello world", BYTES_REPLACEMENTS), b"xeyyz wzrld")
+		self.assertEqual(strings.multiReplace(b"ab", ((b"a", b"b"), (b"b", b"c"))), b"bc")
 
 	def test_regexFuzzy(self) -> None:
 		with self.assertRaises(TypeError):
 			strings.regexFuzzy(None)  # type: ignore[arg-type]
-		self.assertEqual(strings.regexFuzzy(""), "")
-		self.assertEqual(strings.regexFuzzy([]), "")
-		self.assertEqual(strings.regexFuzzy([""]), "")
-		self.assertEqual(strings.regexFuzzy(["", ""]), "|")
-		self.assertEqual(strings.regexFuzzy("east"), "e(a(s(t)?)?)?")
-		self.assertEqual(strings.regexFuzzy(["east"]), "e(a(s(t)?)?)?")
-		self.assertEqual(strings.regexFuzzy("east"), "e(a(s(t)?)?)?")
-		expectedOutput: str = "e(a(s(t)?)?)?|w(e(s(t)?)?)?"
-		self.assertEqual(strings.regexFuzzy(["east", "west"]), expectedOutput)
-		self.assertEqual(strings.regexFuzzy(("east", "west")), expectedOutput)
+		scenarios: tuple[tuple[Union[str, Sequence[str]], str], ...] = (
+			("", ""),
+			([], ""),
+			([""], ""),
+			(["", ""], "|"),
+			("east", FUZZY_EAST),
+			(["east"], FUZZY_EAST),
+			(["east", "west"], FUZZY_EAST_WEST),
+			(("east", "west"), FUZZY_EAST_WEST),
+		)
+		for text, expected in scenarios:
+			with self.subTest(text=text):
+				self.assertEqual(strings.regexFuzzy(text), expected)
 
 	def test_removeWhiteSpace(self) -> None:
 		sent: str = "\tHello world\r\nThis  is\ta\r\n\r\ntest. "
 		expected: str = "HelloworldThisisatest."
 		self.assertEqual(strings.removeWhiteSpace(sent), expected)
+		self.assertEqual(strings.removeWhiteSpace("Hello\u00a0w\u2003rld"), "Hellowrld")
 
 	def test_removeWhiteSpaceExceptSpace(self) -> None:
 		sent: str = "\tHello world\r\nThis  is\ta\r\n\r\ntest. "
@@ -120,3 +144,4 @@ class TestStrings(TestCase):
 		sent: str = "\x1b[32mhello\x1b[0m"
 		expected: str = "hello"
 		self.assertEqual(strings.stripAnsi(sent), expected)
+		self.assertEqual(strings.stripAnsi(expected), expected)
@@ -24,7 +24,6 @@ from __future__ import annotations
 # Built-in Modules:
 import inspect
 import os
-import sys
 import textwrap
 from unittest import TestCase
 from unittest.mock import Mock, patch
@@ -33,38 +32,46 @@ from unittest.mock import Mock, patch
 from knickknacks import utils
 
 
+def getCallerName() -> str:
+	# Shared helper replacing the per-test currentframe boilerplate.
+	frame = inspect.currentframe()
+	if frame is None or frame.f_back is None:
+		raise TypeError("Unable to get reference to the calling frame.")
+	return frame.f_back.f_code.co_name
+
+
+# Shared by test_page; built once at import time instead of per run.
+PAGE_WIDTH: int = 80
+PAGE_LINES: list[str] = "\n".join(
+	[
+		"This is the first line.",
+		"this is the second line.",
+		"123456789 " * 10,
+		"123\n567\n9 " * 10,
+		"long-hyphenated-words-which-should-wrap-on-their-hyphens " * 3,
+		"This is the third and final line.",
+	]
+).splitlines()
+EXPECTED_PAGE_TEXT: str = "\n".join(textwrap.fill(line.strip(), PAGE_WIDTH - 1) for line in PAGE_LINES)
+
+
 class TestUtils(TestCase):
 	def test_getFunctionField(self) -> None:
-		thisFunctionField = inspect.currentframe()
-		if thisFunctionField is None:
-			raise TypeError("thisFunctionField is None.")
-		thisFunctionName = thisFunctionField.f_code.co_name
-		self.assertEqual(utils.getFunctionField().f_code.co_name, thisFunctionName)
-		with self.assertRaises(AttributeError):
-			utils.getFunctionField(sys.getrecursionlimit() * 2)
+		self.assertEqual(utils.getFunctionField().f_code.co_name, getCallerName())
+		# Exhaust the frame chain immediately instead of walking the whole real stack.
+		noFrames = patch("knickknacks.utils.inspect.currentframe", return_value=None)
+		with noFrames, self.assertRaises(AttributeError):
+			utils.getFunctionField()
 
 	def test_getFunctionName(self) -> None:
-		thisFunctionField = inspect.currentframe()
-		if thisFunctionField is None:
-			raise TypeError("thisFunctionField is None.")
-		thisFunctionName = thisFunctionField.f_code.co_name
-		self.assertEqual(utils.getFunctionName(), thisFunctionName)
-		self.assertEqual(utils.getFunctionName(sys.getrecursionlimit() * 2), "")
+		self.assertEqual(utils.getFunctionName(), getCallerName())
+		with patch("knickknacks.utils.inspect.currentframe", return_value=None):
+			self.assertEqual(utils.getFunctionName(), "")
 
-	@patch("knickknacks.utils.pager")
-	@patch("knickknacks.utils.shutil")
+	@patch.object(utils, "pager")
+	@patch.object(utils, "shutil")
 	def test_page(self, mockShutil: Mock, mockPager: Mock) -> None:
-		cols: int = 80
 		rows: int = 24
-		mockShutil.get_terminal_size.return_value = os.terminal_size((cols, rows))
-		lines: list[str] = [
-			"This is the first line.",
-			"this is the second line.",
-			"123456789 " * 10,
-			"123\n567\n9 " * 10,
-			"This is the third and final line.",
-		]
-		lines = "\n".join(lines).splitlines()
-		utils.page(lines)
-		text: str = "\n".join(textwrap.fill(line.strip(), cols - 1) for line in lines)
-		mockPager.assert_called_once_with(text)
+		mockShutil.get_terminal_size.return_value = os.terminal_size((PAGE_WIDTH, rows))
+		utils.page(PAGE_LINES)
+		mockPager.assert_called_once_with(EXPECTED_PAGE_TEXT)
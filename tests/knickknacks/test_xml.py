@@ -22,25 +22,28 @@
 from __future__ import annotations
 
 # Built-in Modules:
+from typing import Optional
 from unittest import TestCase
 
 # Knickknacks Modules:
 from knickknacks import xml
 
 
+# Built once at import time instead of per run.
+UNESCAPED_STRING: str = "<one&two'\">three"
+ESCAPED_STRING: str = "&lt;one&amp;two'\"&gt;three"
+ATTRIBUTES_TEXT: str = 'test1=value1 test2="value2" test3 /'
+EXPECTED_ATTRIBUTES: dict[str, Optional[str]] = {"test1": "value1", "test2": "value2", "test3": None}
+ESCAPED_BYTES: bytes = b"&lt;'\"one&amp;gt;two&gt;three&#35;four&#x5F;&#x5f;five&amp;#35;six"
+UNESCAPED_BYTES: bytes = b"<'\"one&gt;two>three#four__five&#35;six"
+
+
 class TestXML(TestCase):
 	def test_escapeXMLString(self) -> None:
-		originalString: str = "<one&two'\">three"
-		expectedString: str = "&lt;one&amp;two'\"&gt;three"
-		self.assertEqual(xml.escapeXMLString(originalString), expectedString)
+		self.assertEqual(xml.escapeXMLString(UNESCAPED_STRING), ESCAPED_STRING)
 
 	def test_getXMLAttributes(self) -> None:
-		self.assertEqual(
-			xml.getXMLAttributes('test1=value1 test2="value2" test3 /'),
-			{"test1": "value1", "test2": "value2", "test3": None},
-		)
+		self.assertEqual(xml.getXMLAttributes(ATTRIBUTES_TEXT), EXPECTED_ATTRIBUTES)
 
 	def test_unescapeXMLBytes(self) -> None:
-		originalBytes: bytes = b"&lt;'\"one&amp;gt;two&gt;three&#35;four&#x5F;&#x5f;five&amp;#35;six"
-		expectedBytes: bytes = b"<'\"one&gt;two>three#four__five&#35;six"
-		self.assertEqual(xml.unescapeXMLBytes(originalBytes), expectedBytes)
+		self.assertEqual(xml.unescapeXMLBytes(ESCAPED_BYTES), UNESCAPED_BYTES)